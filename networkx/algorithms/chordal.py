@@ -8,7 +8,6 @@ https://en.wikipedia.org/wiki/Chordal_graph
 import sys
 
 import networkx as nx
-from networkx.algorithms.components import connected_components
 from networkx.utils import arbitrary_element, not_implemented_for
 
 __all__ = [
@@ -154,26 +153,28 @@ def find_induced_nodes(G, s, t, treewidth_bound=sys.maxsize):
     while triplet:
         (u, v, w) = triplet
         induced_nodes.update(triplet)
-        for n in triplet:
-            if n != s:
-                H.add_edge(s, n)
+        H.add_edges_from((s, n) for n in triplet if n != s)
+        # The search is restarted rather than resumed: s is numbered first, so
+        # the new edges change the cardinalities from the second step on.
         triplet = _find_chordality_breaker(H, s, treewidth_bound)
     if induced_nodes:
         # Add t and the second node in the induced path from s to t.
         induced_nodes.add(t)
         for u in G[s]:
-            if len(induced_nodes & set(G[u])) == 2:
+            if len(induced_nodes.intersection(G._adj[u])) == 2:
                 induced_nodes.add(u)
                 break
     return induced_nodes
 
 
+@not_implemented_for("directed")
 @nx._dispatch
 def chordal_graph_cliques(G):
     """Returns all maximal cliques of a chordal graph.
 
-    The algorithm breaks the graph in connected components and performs a
-    maximum cardinality search in each component to get the cliques.
+    The algorithm performs a single maximum cardinality search over the
+    graph, which visits the connected components one after the other, and
+    collects the cliques along the way.
 
     Parameters
     ----------
@@ -188,8 +189,10 @@ def chordal_graph_cliques(G):
 
     Raises
     ------
+    NetworkXNotImplemented
+        The algorithm does not support DiGraph and MultiDiGraph.
+
     NetworkXError
-        The algorithm does not support DiGraph, MultiGraph and MultiDiGraph.
         The algorithm can only be applied to chordal graphs. If the input
         graph is found to be non-chordal, a :exc:`NetworkXError` is raised.
 
@@ -214,33 +217,11 @@ def chordal_graph_cliques(G):
     >>> cliques[0]
     frozenset({1, 2, 3})
     """
-    for C in (G.subgraph(c).copy() for c in connected_components(G)):
-        if C.number_of_nodes() == 1:
-            if nx.number_of_selfloops(C) > 0:
-                raise nx.NetworkXError("Input graph is not chordal.")
-            yield frozenset(C.nodes())
-        else:
-            unnumbered = set(C.nodes())
-            v = arbitrary_element(C)
-            unnumbered.remove(v)
-            numbered = {v}
-            clique_wanna_be = {v}
-            while unnumbered:
-                v = _max_cardinality_node(C, unnumbered, numbered)
-                unnumbered.remove(v)
-                numbered.add(v)
-                new_clique_wanna_be = set(C.neighbors(v)) & numbered
-                sg = C.subgraph(clique_wanna_be)
-                if _is_complete_graph(sg):
-                    new_clique_wanna_be.add(v)
-                    if not new_clique_wanna_be >= clique_wanna_be:
-                        yield frozenset(clique_wanna_be)
-                    clique_wanna_be = new_clique_wanna_be
-                else:
-                    raise nx.NetworkXError("Input graph is not chordal.")
-            yield frozenset(clique_wanna_be)
+    yield from map(frozenset, _chordal_graph_cliques(G))
 
 
+@not_implemented_for("directed")
+@not_implemented_for("multigraph")
 @nx._dispatch
 def chordal_graph_treewidth(G):
     """Returns the treewidth of the chordal graph G.
@@ -257,8 +238,10 @@ def chordal_graph_treewidth(G):
 
     Raises
     ------
-    NetworkXError
+    NetworkXNotImplemented
         The algorithm does not support DiGraph, MultiGraph and MultiDiGraph.
+
+    NetworkXError
         The algorithm can only be applied to chordal graphs. If the input
         graph is found to be non-chordal, a :exc:`NetworkXError` is raised.
 
@@ -282,51 +265,118 @@ def chordal_graph_treewidth(G):
     >>> nx.chordal_graph_treewidth(G)
     3
 
+    Notes
+    -----
+    Chordality is not checked separately: the maximum cardinality search
+    that finds the cliques fails as soon as G turns out to be non-chordal.
+
     References
     ----------
     .. [1] https://en.wikipedia.org/wiki/Tree_decomposition#Treewidth
     """
-    if not is_chordal(G):
-        raise nx.NetworkXError("Input graph is not chordal.")
+    return max(map(len, _chordal_graph_cliques(G)), default=0) - 1
 
-    max_clique = -1
-    for clique in nx.chordal_graph_cliques(G):
-        max_clique = max(max_clique, len(clique))
-    return max_clique - 1
 
+def _chordal_graph_cliques(G):
+    """Yields the maximal cliques of the chordal graph G as sets of nodes.
 
-def _is_complete_graph(G):
-    """Returns True if G is a complete graph."""
-    if nx.number_of_selfloops(G) > 0:
-        raise nx.NetworkXError("Self loop found in _is_complete_graph()")
-    n = G.number_of_nodes()
-    if n < 2:
-        return True
-    e = G.number_of_edges()
-    max_edges = (n * (n - 1)) / 2
-    return e == max_edges
+    The yielded sets are not copied, so callers that only need the size of
+    each clique (like `chordal_graph_treewidth`) avoid building a frozenset
+    per clique. Raises NetworkXError if G is found to be non-chordal.
+    """
+    if len(G) == 0:
+        return
+    G_adj = G._adj  # Store as a variable to eliminate attribute lookup
+    numbered = set()
+    numbered_add = numbered.add
+    clique_wanna_be = set()
+    for v, p in _maximum_cardinality_search(G, arbitrary_element(G)):
+        G_v = G_adj[v]
+        if v in G_v:
+            # self loops are checked here rather than in a separate pass
+            raise nx.NetworkXError("Input graph is not chordal.")
+        new_clique_wanna_be = numbered.intersection(G_v)
+        w = _find_non_neighbor_of_parent(G_adj, new_clique_wanna_be, p)
+        if w is not None:
+            raise nx.NetworkXError("Input graph is not chordal.")
+        numbered_add(v)
+        new_clique_wanna_be.add(v)
+        # In a maximum cardinality search of a chordal graph, v extends the
+        # previous clique exactly when its cardinality grew by one, so
+        # comparing sizes replaces a subset test. The search finishes a
+        # connected component before moving on, so a node starting a new
+        # component has no numbered neighbors and also closes the clique.
+        if len(new_clique_wanna_be) <= len(clique_wanna_be):
+            yield clique_wanna_be
+        clique_wanna_be = new_clique_wanna_be
+    yield clique_wanna_be
+
+
+def _maximum_cardinality_search(G, s):
+    """Yields the nodes of G in maximum cardinality search order, starting at s.
+
+    Each yielded item is a pair (v, parent) where v is the unnumbered node
+    with the most numbered neighbors and parent is the most recently numbered
+    of those neighbors (None if v has no numbered neighbors). A node counts
+    as numbered once it has been yielded.
+
+    The cardinalities are kept in buckets and updated incrementally, which
+    gives the O(n + m) running time of Tarjan and Yannakakis.
+    """
+    G_adj = G._adj  # Store as a variable to eliminate attribute lookup
+    card = dict.fromkeys(G, 0)
+    del card[s]
+    parent = {}
+    # buckets[i] holds the nodes whose cardinality became i. Entries are not
+    # removed when a cardinality grows; stale ones are skipped when popped.
+    buckets = [list(card)]
+    max_card = 0
+    v = s
+    while True:
+        yield v, parent.pop(v, None)
+        for u in G_adj[v]:
+            if u in card:
+                parent[u] = v
+                c = card[u] + 1
+                card[u] = c
+                if c == len(buckets):
+                    buckets.append([u])
+                else:
+                    buckets[c].append(u)
+                if c > max_card:
+                    max_card = c
+        if not card:
+            return
+        while True:
+            bucket = buckets[max_card]
+            if not bucket:
+                max_card -= 1
+                continue
+            v = bucket.pop()
+            # numbered nodes are no longer in card
+            if card.get(v) == max_card:
+                break
+        del card[v]
 
 
-def _find_missing_edge(G):
-    """Given a non-complete graph G, returns a missing edge."""
-    nodes = set(G)
-    for u in G:
-        missing = nodes - set(list(G[u].keys()) + [u])
-        if missing:
-            return (u, missing.pop())
+def _find_non_neighbor_of_parent(G_adj, clique_wanna_be, parent):
+    """Returns a node of clique_wanna_be that is neither parent nor adjacent
+    to parent, or None if there is no such node.
 
+    clique_wanna_be holds the numbered neighbors of the node being numbered
+    and parent is the most recently numbered of them. Provided every node
+    numbered before has passed this test, clique_wanna_be is a clique if and
+    only if this returns None (Tarjan and Yannakakis, 1984).
 
-def _max_cardinality_node(G, choices, wanna_connect):
-    """Returns a the node in choices that has more connections in G
-    to nodes in wanna_connect.
+    G_adj is the adjacency of the graph, e.g. ``G._adj``.
     """
-    max_number = -1
-    for x in choices:
-        number = len([y for y in G[x] if y in wanna_connect])
-        if number > max_number:
-            max_number = number
-            max_cardinality_node = x
-    return max_cardinality_node
+    if parent is None:
+        return None
+    parent_nbrs = G_adj[parent]
+    for u in clique_wanna_be:
+        if u != parent and u not in parent_nbrs:
+            return u
+    return None
 
 
 def _find_chordality_breaker(G, s=None, treewidth_bound=sys.maxsize):
@@ -334,37 +384,36 @@ def _find_chordality_breaker(G, s=None, treewidth_bound=sys.maxsize):
     (starting from s if s is given and from an arbitrary node otherwise)
     trying to find a non-chordal cycle.
 
-    If it does find one, it returns (u,v,w) where u,v,w are the three
-    nodes that together with s are involved in the cycle.
+    If it does find one, it returns (u,v,w) where u and w are numbered
+    neighbors of v that are not adjacent to each other, and u is the most
+    recently numbered neighbor of v. The path u-v-w then lies on a
+    chordless cycle of length at least 4; s may be one of the three nodes.
 
     It ignores any self loops.
     """
     if len(G) == 0:
         raise nx.NetworkXPointlessConcept("Graph has no nodes.")
-    unnumbered = set(G)
     if s is None:
         s = arbitrary_element(G)
-    unnumbered.remove(s)
-    numbered = {s}
+    G_adj = G._adj  # Store as a variable to eliminate attribute lookup
+    mcs = _maximum_cardinality_search(G, s)
+    numbered = {next(mcs)[0]}
+    numbered_add = numbered.add
     current_treewidth = -1
-    while unnumbered:  # and current_treewidth <= treewidth_bound:
-        v = _max_cardinality_node(G, unnumbered, numbered)
-        unnumbered.remove(v)
-        numbered.add(v)
-        clique_wanna_be = set(G[v]) & numbered
-        sg = G.subgraph(clique_wanna_be)
-        if _is_complete_graph(sg):
-            # The graph seems to be chordal by now. We update the treewidth
-            current_treewidth = max(current_treewidth, len(clique_wanna_be))
+    for v, p in mcs:
+        clique_wanna_be = numbered.intersection(G_adj[v])
+        w = _find_non_neighbor_of_parent(G_adj, clique_wanna_be, p)
+        if w is not None:
+            # clique_wanna_be is not a clique, (p, w) is a missing edge in it
+            return (p, v, w)
+        # The graph seems to be chordal by now. We update the treewidth
+        if len(clique_wanna_be) > current_treewidth:
+            current_treewidth = len(clique_wanna_be)
             if current_treewidth > treewidth_bound:
                 raise nx.NetworkXTreewidthBoundExceeded(
                     f"treewidth_bound exceeded: {current_treewidth}"
                 )
-        else:
-            # sg is not a clique,
-            # look for an edge that is not included in sg
-            (u, w) = _find_missing_edge(sg)
-            return (u, v, w)
+        numbered_add(v)
     return ()
 
 
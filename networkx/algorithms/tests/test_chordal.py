@@ -66,6 +66,15 @@ class TestMCS:
         assert not nx.is_chordal(nx.cycle_graph(5))
         assert nx.is_chordal(self.self_loop_G)
 
+    def test_is_chordal_larger_graphs(self):
+        assert nx.is_chordal(nx.complete_graph(20))
+        assert nx.is_chordal(nx.balanced_tree(2, 6))
+        assert nx.is_chordal(nx.barbell_graph(8, 0))
+        assert not nx.is_chordal(nx.cycle_graph(50))
+        assert not nx.is_chordal(nx.grid_2d_graph(6, 6))
+        H, _ = nx.complete_to_chordal_graph(nx.grid_2d_graph(6, 6))
+        assert nx.is_chordal(H)
+
     def test_induced_nodes(self):
         G = nx.generators.classic.path_graph(10)
         Induced_nodes = nx.find_induced_nodes(G, 1, 9, 2)
@@ -75,11 +84,29 @@ class TestMCS:
         )
         Induced_nodes = nx.find_induced_nodes(self.chordal_G, 1, 6)
         assert Induced_nodes == {1, 2, 4, 6}
+        G = nx.Graph([(0, 1), (0, 4), (1, 3), (1, 4), (2, 3)])
+        assert nx.find_induced_nodes(G, 0, 2) == {0, 1, 2, 3}
         pytest.raises(nx.NetworkXError, nx.find_induced_nodes, self.non_chordal_G, 1, 5)
 
     def test_graph_treewidth(self):
+        assert nx.chordal_graph_treewidth(self.chordal_G) == 3
+        assert nx.chordal_graph_treewidth(nx.path_graph(10)) == 1
+        assert nx.chordal_graph_treewidth(nx.empty_graph(3)) == 0
+        assert nx.chordal_graph_treewidth(nx.Graph()) == -1
         with pytest.raises(nx.NetworkXError, match="Input graph is not chordal"):
             nx.chordal_graph_treewidth(self.non_chordal_G)
+        with pytest.raises(nx.NetworkXError, match="Input graph is not chordal"):
+            nx.chordal_graph_treewidth(nx.cycle_graph(5))
+
+    @pytest.mark.parametrize("G", (nx.DiGraph(), nx.MultiGraph(), nx.MultiDiGraph()))
+    def test_graph_treewidth_not_implemented(self, G):
+        with pytest.raises(nx.NetworkXNotImplemented):
+            nx.chordal_graph_treewidth(G)
+
+    @pytest.mark.parametrize("G", (nx.DiGraph(), nx.MultiDiGraph()))
+    def test_chordal_find_cliques_not_implemented(self, G):
+        with pytest.raises(nx.NetworkXNotImplemented):
+            set(nx.chordal_graph_cliques(G))
 
     def test_chordal_find_cliques(self):
         cliques = {
@@ -94,6 +121,18 @@ class TestMCS:
             set(nx.chordal_graph_cliques(self.non_chordal_G))
         with pytest.raises(nx.NetworkXError, match="Input graph is not chordal"):
             set(nx.chordal_graph_cliques(self.self_loop_G))
+        G = nx.path_graph(5)
+        G.add_edge(4, 4)
+        with pytest.raises(nx.NetworkXError, match="Input graph is not chordal"):
+            set(nx.chordal_graph_cliques(G))
+
+    def test_chordal_find_cliques_components(self):
+        assert list(nx.chordal_graph_cliques(nx.Graph())) == []
+        cliques = set(nx.chordal_graph_cliques(nx.empty_graph(3)))
+        assert cliques == {frozenset([0]), frozenset([1]), frozenset([2])}
+        G = nx.disjoint_union_all([nx.complete_graph(4), nx.path_graph(3)] * 3)
+        cliques = {frozenset(c) for c in nx.find_cliques(G)}
+        assert set(nx.chordal_graph_cliques(G)) == cliques
 
     def test_chordal_find_cliques_path(self):
         G = nx.path_graph(10)